@@ -8,15 +8,601 @@ Meekah Yzabelle Carballo
 Satori Pelayo
 """
 
+import collections
 import csv
+import operator
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
-from typing import Tuple
+from typing import Optional, Tuple
 import tkinter.simpledialog as simpledialog
 
+# File I/O streaming: characters per read, chunks buffered between threads,
+# chunks inserted per event loop slice, editor lines per saved chunk, and the
+# delay in milliseconds between slices
+FILE_CHUNK_SIZE = 1 << 16
+FILE_QUEUE_SIZE = 16
+FILE_CHUNKS_PER_SLICE = 4
+EDITOR_LINES_PER_SLICE = 2000
+FILE_POLL_INTERVAL = 1
+
+
+class LL1Parser:
+    """
+    Table-driven LL(1) parser fed one token kind at a time.
+    """
+
+    def __init__(self, productions, parse_table, trace=None):
+        self.productions = productions
+        self.parse_table = parse_table
+        self.trace = trace  # Called with every Match/Output action when set
+        self.stack = [productions[0][1]]  # Start symbol is the LHS of the first production
+
+        # Right-hand sides are split once, reversed in the order they are pushed
+        self.expansions = [production[2].split()[::-1] if production[2] != 'e' else [] for production in productions]
+
+    def feed(self, token) -> Optional[str]:
+        """
+        Expands non-terminals until the token is matched.
+
+        Args:
+            token (str): Token kind of the next input token.
+
+        Returns:
+            str: The error message if the token cannot be parsed; None otherwise.
+        """
+        stack = self.stack
+        while stack:
+            stack_top = stack[-1]
+
+            # Match terminal symbols
+            if stack_top == token:
+                stack.pop()
+                if self.trace:
+                    self.trace(f'Match {stack_top}')
+                return None
+
+            # Expand non-terminal symbols
+            row = self.parse_table.get(stack_top)
+            if row is None:
+                return f'Unexpected token {stack_top}'
+            production_number = row.get(token)
+            if production_number is None:
+                return f'No matching terminal for {stack_top} with input {token}'
+            if production_number == '':
+                return f'No rule found for {stack_top} with input {token}'
+
+            stack.pop()
+            index = int(production_number) - 1
+            stack.extend(self.expansions[index])
+            if self.trace:
+                production = self.productions[index]
+                self.trace(f'Output {production[1]} -> {production[2]}')
+
+        return 'Input buffer not exhausted.'
+
+    def finish(self) -> Optional[str]:
+        """
+        Feeds the end marker once all tokens are in.
+
+        Returns:
+            str: The error message if the input ended early; None otherwise.
+        """
+        return self.feed('$') if self.stack else None
+
+
+# Arithmetic operations and how to evaluate them on known INT values
+OPERATIONS = {
+    'ADD': operator.add,
+    'SUB': operator.sub,
+    'MULT': operator.mul,
+    'DIV': operator.floordiv,
+    'MOD': operator.mod,
+}
+
+# Folded INT values past this magnitude are treated as unknown, so folding stays cheap
+INT_VALUE_LIMIT = 2**63 - 1
+INT_LITERAL_DIGITS = len(str(INT_VALUE_LIMIT)) - 1
+
+# Printed in place of values only known at run time or too large to fold
+UNKNOWN_OUTPUT = 'Unknown'
+
+
+# Semantic state of the statement being checked
+class StatementContext:
+    __slots__ = ('keyword', 'line_num', 'target', 'in_expression', 'operations', 'result')
+
+    def __init__(self, keyword, line_num):
+        self.keyword = keyword
+        self.line_num = line_num
+        self.target = None  # Variable declared, assigned, or read by the statement
+        self.in_expression = keyword == 'PRINT'  # PRINT is followed by its expression right away
+        self.operations = []  # Pending [operation, operands] frames of the prefix expression
+        self.result = None  # (type, value) of the finished expression
+
+
+class SemanticChecker:
+    """
+    Static semantic checker fed one token at a time.
+
+    Each token kind is dispatched to a handler through a table, and all state lives in
+    the context of the current statement, so checking takes one pass over the tokens.
+    """
+
+    def __init__(self, variables, output=None, inputs=None):
+        self.variables = variables  # Shared variable table holding types and values
+        self.inputs = {} if inputs is None else inputs  # Values entered for BEG, if any
+        self.declared = {}  # Variables declared so far, in program order, and their types
+        self.values = {}  # Known value of each variable at this point; None when unknown
+        self.errors = []  # (line number, message) of every semantic error
+        self.output = [] if output is None else output  # Any object with append() for PRINT/NEWLN output
+        self.context = None
+
+        self.handlers = {
+            'IOL': self.handle_program_marker,
+            'LOI': self.handle_program_marker,
+            'INT': self.handle_statement,
+            'STR': self.handle_statement,
+            'INTO': self.handle_statement,
+            'BEG': self.handle_statement,
+            'PRINT': self.handle_statement,
+            'NEWLN': self.handle_newline,
+            'IS': self.handle_is,
+            'IDENT': self.handle_identifier,
+            'INT_LIT': self.handle_literal,
+        }
+        for operation in OPERATIONS:
+            self.handlers[operation] = self.handle_operation
+
+    def feed(self, line_num, lexeme, token):
+        self.handlers.get(token, self.handle_unexpected)(line_num, lexeme, token)
+
+    def finish(self) -> Tuple[list, list]:
+        """
+        Closes the last statement.
+
+        Returns:
+            tuple: The list of semantic errors as (line_number, message) tuples and the
+            list of program output lines.
+        """
+        self.end_statement()
+        return self.errors, self.output
+
+    def report(self, line_num, message):
+        self.errors.append((line_num, f'Line {line_num}: {message}'))
+
+    def end_statement(self):
+        context = self.context
+        self.context = None
+        if context is None:
+            return
+
+        if context.target is None and context.keyword != 'PRINT':
+            self.report(context.line_num, f'Missing variable after {context.keyword} command.')
+        elif context.operations:
+            self.report(context.line_num, f'Incomplete expression in {context.keyword} statement.')
+        elif context.result is None and (context.in_expression or context.keyword == 'INTO'):
+            self.report(context.line_num, f'Missing expression after {context.keyword} command.')
+
+    def handle_program_marker(self, line_num, lexeme, token):
+        self.end_statement()
+
+    def handle_statement(self, line_num, lexeme, token):
+        self.end_statement()
+        self.context = StatementContext(token, line_num)
+
+    def handle_newline(self, line_num, lexeme, token):
+        self.end_statement()
+        # Line ends are NEWLN tokens too; only the NEWLN statement produces output
+        if lexeme == 'NEWLN':
+            self.output.append('\n')
+
+    def handle_is(self, line_num, lexeme, token):
+        context = self.context
+        if context is None or context.target is None or context.keyword not in {'INT', 'INTO'}:
+            self.handle_unexpected(line_num, lexeme, token)
+        else:
+            context.in_expression = True
+
+    def handle_identifier(self, line_num, lexeme, token):
+        context = self.context
+        if context is None:
+            self.handle_unexpected(line_num, lexeme, token)
+        elif context.in_expression:
+            var_type = self.declared.get(lexeme)
+            if var_type is None:
+                self.report(line_num, f"Undeclared variable '{lexeme}' used.")
+                self.push_operand(line_num, None, None)
+            else:
+                self.push_operand(line_num, var_type, self.values[lexeme])
+        elif context.target is None:
+            context.target = lexeme
+            self.bind_target(context)
+        else:
+            self.handle_unexpected(line_num, lexeme, token)
+
+    def bind_target(self, context):
+        name = context.target
+        if context.keyword in {'INT', 'STR'}:
+            if name in self.declared:
+                self.report(context.line_num, f"Variable '{name}' is already declared.")
+                return
+            self.declared[name] = context.keyword
+            default_value = 0 if context.keyword == 'INT' else 'Unassigned'
+            self.values[name] = default_value
+            self.variables.setdefault(name, {'type': context.keyword, 'value': default_value})
+        elif name not in self.declared:
+            if context.keyword == 'INTO':
+                self.report(context.line_num, f"Undeclared variable '{name}' in assignment.")
+            else:
+                self.report(context.line_num, f"Undeclared variable '{name}' used in input operation.")
+        elif context.keyword == 'BEG':
+            # The value read at run time is only known if it was entered before checking
+            value = self.inputs.get(name)
+            if self.declared[name] == 'INT' and not self.is_known_int(value):
+                value = None
+            self.values[name] = value
+
+    def handle_literal(self, line_num, lexeme, token):
+        if self.context is None or not self.context.in_expression:
+            self.handle_unexpected(line_num, lexeme, token)
+        else:
+            value = int(lexeme) if len(lexeme) <= INT_LITERAL_DIGITS else None
+            self.push_operand(line_num, 'INT', value)
+
+    def handle_operation(self, line_num, lexeme, token):
+        if self.context is None or not self.context.in_expression:
+            self.handle_unexpected(line_num, lexeme, token)
+        else:
+            self.context.operations.append([token, []])
+
+    def handle_unexpected(self, line_num, lexeme, token):
+        self.report(line_num, f"Unexpected token '{lexeme}' ({token}).")
+
+    def push_operand(self, line_num, operand_type, value):
+        """
+        Adds an operand to the prefix expression, evaluating every operation whose
+        operands are now complete.
+        """
+        context = self.context
+        operand = (operand_type, value)
+        while context.operations:
+            operation, operands = context.operations[-1]
+            if operand[0] == 'STR':
+                self.report(line_num, f'Type mismatch: {operation} operation requires INT, found STR.')
+            operands.append(operand)
+            if len(operands) < 2:
+                return
+
+            context.operations.pop()
+            operand = ('INT', self.evaluate(line_num, operation, operands))
+
+        context.result = operand
+        context.in_expression = False
+        self.complete_expression(context)
+
+    def evaluate(self, line_num, operation, operands):
+        (_, left), (_, right) = operands
+        if not self.is_known_int(left) or not self.is_known_int(right):
+            return None
+        try:
+            value = OPERATIONS[operation](left, right)
+        except ZeroDivisionError:
+            self.report(line_num, f'Division by zero in {operation} operation.')
+            return None
+        return value if self.is_known_int(value) else None
+
+    @staticmethod
+    def is_known_int(value):
+        return isinstance(value, int) and -INT_VALUE_LIMIT <= value <= INT_VALUE_LIMIT
+
+    def complete_expression(self, context):
+        result_type, value = context.result
+        if context.keyword == 'PRINT':
+            if result_type is not None:
+                shown = UNKNOWN_OUTPUT if value is None else value
+                self.output.append(f'Line {context.line_num} Output: {shown}\n')
+            return
+
+        target_type = self.declared.get(context.target)
+        if target_type is None or result_type is None:
+            return  # Already reported as undeclared
+        if result_type != target_type:
+            self.report(
+                context.line_num,
+                f"Type mismatch: Cannot assign {result_type} expression to '{context.target}' of type '{target_type}'.",
+            )
+        else:
+            self.values[context.target] = value
+
+
+# Headless analysis phases shared by the GUI and the command-line tools
+class IOLAnalyzer:
+    def __init__(self):
+        # Token stream path
+        self.token_file_path = 'output.tkn'
+
+        # Store token stream, error list, and variable details (name, type)
+        self.token_stream = []
+        self.error_list = []
+        self.variables = {}
+        self.input_values = {}  # Values entered for BEG before semantic analysis
+
+        self.production_filename = 'IOL_Grammar.prod'
+        self.parse_table_filename = 'IOL_ParseTable.ptbl'
+        self.productions_values = None
+        self.parse_table_values = None
+
+    # Perform lexical analysis to generate tokens and identify errors
+    def lexical_analysis(self, code):
+        self.error_list = []
+        return list(self.tokenize(code.splitlines()))
+
+    # Generate tokens line by line, recording lexical errors in the error list before
+    # yielding the token they belong to
+    def tokenize(self, lines):
+        keywords = {
+            'IOL',
+            'LOI',
+            'INTO',
+            'IS',
+            'BEG',
+            'NEWLN',
+            'PRINT',
+            'ADD',
+            'SUB',
+            'MULT',
+            'DIV',
+            'MOD',
+        }
+        types = {'INT', 'STR'}
+
+        for line_num, line in enumerate(lines, start=1):
+            words = line.split()
+            if not words:
+                continue
+
+            for i, word in enumerate(words):
+                if word in keywords or word in types:
+                    if word in types and i + 1 < len(words):
+                        var_name = words[i + 1]
+                        if var_name.isidentifier():
+                            default_value = 0 if word == 'INT' else 'Unassigned'
+                            self.variables[var_name] = {
+                                'type': word,
+                                'value': default_value,
+                            }
+                        else:
+                            self.error_list.append(f"Invalid identifier '{var_name}' on line {line_num}")
+                    yield line_num, word, word
+                elif word.isdigit():
+                    yield line_num, word, 'INT_LIT'
+                elif word.isidentifier():
+                    yield line_num, word, 'IDENT'
+                else:
+                    self.error_list.append(f"Unknown lexeme '{word}' on line {line_num}")
+                    yield line_num, word, 'ERR_LEX'
+
+            # Add a NEWLN token at the end of each line
+            last_word = words[-1]
+            if not last_word.endswith('LOI'):
+                yield line_num, '\\n', 'NEWLN'
+
+    def parse_tokens_with_grammar(self, productions: list, parse_table: dict, trace=print) -> Tuple[bool, str]:
+        """
+        Parses tokens from the input field using a specified grammar.
+
+        Args:
+            productions (list): List of production rules as (line_number, non_terminal, production).
+            parse_table (dict): Dictionary representing the parse table.
+            trace (Callable): Called with every parser action and error; None to stay silent.
+
+        Returns:
+            bool: True if the input is valid based on the grammar; False otherwise.
+        """
+        error_msg = None
+        if not self.token_stream:
+            error_msg = 'Error: No input tokens provided!'
+        else:
+            error_msg, _ = self.find_syntax_error(productions, parse_table, trace)
+            if error_msg:
+                error_msg = f'Error: {error_msg}'
+
+        if error_msg:
+            if trace:
+                trace(error_msg)
+            return False, error_msg
+
+        return True, None
+
+    def find_syntax_error(self, productions: list, parse_table: dict, trace=None) -> Tuple[Optional[str], int]:
+        """
+        Runs the LL(1) parser over the token stream.
+
+        Returns:
+            tuple: The error message, or None if the tokens parse, and the line number
+            of the token the parser stopped at.
+        """
+        parser = LL1Parser(productions, parse_table, trace=trace)
+        line_num = 0
+        for line_num, _, token in self.token_stream:
+            error_msg = parser.feed(token)
+            if error_msg:
+                return error_msg, line_num
+        return parser.finish(), line_num
+
+    def load_productions(self, file_path):
+        """
+        Loads production rules from a .prod file.
+
+        Args:
+            file_path (str): Path to the production file.
+
+        Returns:
+            list: List of production rules.
+        """
+        productions = []
+        with open(file_path, newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                productions.append(row)
+        return productions
+
+    def load_parse_table(self, file_path):
+        """
+        Loads parse table from a .ptbl file.
+
+        Args:
+            file_path (str): Path to the parse table file.
+
+        Returns:
+            dict: Dictionary representing the parse table.
+        """
+        parse_table = {}
+        with open(file_path, newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            headers = next(reader)[1:]
+            for row in reader:
+                non_terminal = row[0]
+                parse_table[non_terminal] = {headers[i]: row[i + 1] for i in range(len(headers))}
+        return parse_table
+
+    def format_token_stream(self) -> str:
+        """
+        Serializes the token stream into the .tkn format, skipping NEWLN tokens.
+
+        Returns:
+            str: One `line -> lexeme -> token` entry per line.
+        """
+        return '\n'.join(
+            f'{line_num} -> {lexeme} -> {token}' for line_num, lexeme, token in self.token_stream if token != 'NEWLN'
+        )
+
+    def check_semantics(self) -> Tuple[list, list]:
+        """
+        Runs the static semantic checks over the current token stream.
+
+        Returns:
+            tuple: The list of semantic errors as (line_number, message) tuples and the
+            list of output lines produced by PRINT and NEWLN statements.
+        """
+        checker = SemanticChecker(self.variables, inputs=self.input_values)
+        for line_num, lexeme, token in self.token_stream:
+            checker.feed(line_num, lexeme, token)
+        return checker.finish()
+
+    def compile_source(self, code, trace=None) -> list:
+        """
+        Runs lexical, syntax, and semantic analysis without the GUI, stopping at the
+        first phase that reports errors.
+
+        Args:
+            code (str): Program source code.
+            trace (Callable): Called with every parser action; None to stay silent.
+
+        Returns:
+            list: Diagnostics as (phase, line_number, message) tuples; empty if the
+            program is valid. The line number is 0 when no token is involved.
+        """
+        self.variables = {}
+        self.input_values = {}
+        self.error_list = []
+        self.token_stream = []
+        diagnostics = []
+
+        # The lexer records an error just before yielding the token it belongs to
+        for token in self.tokenize(code.splitlines()):
+            if self.error_list:
+                diagnostics.extend(('lexical', token[0], error) for error in self.error_list)
+                self.error_list.clear()
+            self.token_stream.append(token)
+        if diagnostics:
+            return diagnostics
+
+        if not self.token_stream:
+            return [('syntax', 0, 'No input tokens provided!')]
+
+        self.load_grammar()
+        error_msg, line_num = self.find_syntax_error(self.productions_values, self.parse_table_values, trace)
+        if error_msg:
+            return [('syntax', line_num, f'Line {line_num}: {error_msg}')]
+
+        semantic_errors, _ = self.check_semantics()
+        return [('semantic', line_num, error) for line_num, error in semantic_errors]
+
+    # Load the grammar files once and reuse them for every program
+    def load_grammar(self):
+        if self.productions_values is None:
+            self.productions_values = self.load_productions(self.production_filename)
+            self.parse_table_values = self.load_parse_table(self.parse_table_filename)
+
+    def compile_stream(self, lines, error_limit=1) -> list:
+        """
+        Lexes, parses, and checks a program in a single pass: each token goes from the
+        lexer straight to the LL(1) parser and the semantic checker, so neither the
+        token stream nor the program output is kept in memory.
+
+        Parsing and semantic checks stop at the first lexical or syntax error, as the
+        errors they would report from then on only follow from it; lexing continues so
+        later lexical errors are still reported, until the error limit is reached.
+
+        Args:
+            lines (Iterable[str]): Program source lines, such as an open file.
+            error_limit (int): Stop after this many diagnostics; 0 reports all of them.
+
+        Returns:
+            list: Diagnostics as (phase, line_number, message) tuples, in the order they
+            were found.
+
+        Raises:
+            ValueError: If error_limit is negative.
+        """
+        if error_limit < 0:
+            raise ValueError(f'error_limit must be 0 or positive, got {error_limit}')
+
+        self.variables = {}
+        self.input_values = {}
+        self.error_list = []
+        self.load_grammar()
+        parser = LL1Parser(self.productions_values, self.parse_table_values)
+        checker = SemanticChecker(self.variables, output=collections.deque(maxlen=0))
+        diagnostics = []
+        parsing = True
+        line_num = 0
+
+        for line_num, lexeme, token in self.tokenize(lines):
+            if self.error_list:
+                diagnostics.extend(('lexical', line_num, error) for error in self.error_list)
+                self.error_list.clear()
+                parsing = False
+            if parsing:
+                error_msg = parser.feed(token)
+                if error_msg:
+                    diagnostics.append(('syntax', line_num, f'Line {line_num}: {error_msg}'))
+                    parsing = False
+                else:
+                    checker.feed(line_num, lexeme, token)
+                    if checker.errors:
+                        diagnostics.extend(('semantic', error_line, error) for error_line, error in checker.errors)
+                        checker.errors.clear()
+            if error_limit and len(diagnostics) >= error_limit:
+                return diagnostics[:error_limit]
+
+        if not line_num:
+            diagnostics.append(('syntax', 0, 'No input tokens provided!'))
+        elif parsing:
+            error_msg = parser.finish()
+            if error_msg:
+                diagnostics.append(('syntax', line_num, f'Line {line_num}: {error_msg}'))
+            else:
+                diagnostics.extend(('semantic', error_line, error) for error_line, error in checker.finish()[0])
+        return diagnostics[:error_limit] if error_limit else diagnostics
+
 
 # Main application class
-class CompilerUI(tk.Tk):
+class CompilerUI(tk.Tk, IOLAnalyzer):
     def __init__(self):
         super().__init__()
 
@@ -25,9 +611,8 @@ class CompilerUI(tk.Tk):
         self.configure(bg='#f0f0f0')
         self.font_style = ('Courier', 12)
 
-        # File and Token Stream Paths
+        # File path and token state
         self.file_path = None
-        self.token_file_path = 'output.tkn'
         self.token_saved = False  # To track if tokens have been saved
 
         # Create Menu Bar
@@ -42,6 +627,11 @@ class CompilerUI(tk.Tk):
         file_menu.add_command(label='Save', command=self.save_file)
         file_menu.add_command(label='Save As', command=self.save_file_as)
 
+        # Status bar for file open/save progress
+        self.status_label = tk.Label(self, text='', font=('Courier', 10), bg='#f0f0f0', anchor=tk.W)
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=(0, 5))
+        self.file_io_busy = False  # To track if a file is being opened or saved
+
         # Create a frame for buttons and align them horizontally
         button_frame = tk.Frame(self, bg='#f0f0f0')
         button_frame.pack(pady=15)
@@ -158,22 +748,18 @@ class CompilerUI(tk.Tk):
         )
         self.console_area.pack(padx=5, pady=5, expand=True, fill=tk.BOTH)
 
-        # Store token stream, error list, and variable details (name, type)
-        self.token_stream = []
-        self.error_list = []
-        self.variables = {}
+        # Token stream, error list, variable table, and grammar file paths
+        IOLAnalyzer.__init__(self)
 
-        self.production_filename = 'IOL_Grammar.prod'
-        self.parse_table_filename = 'IOL_ParseTable.ptbl'
         self.is_production_loaded = False
         self.is_parsetable_loaded = False
 
-        self.productions_values = None
-        self.parse_table_values = None
         self.token_stream_for_syntax_analysis = None
 
     # Clear editor, output, and console when creating a new file
     def new_file(self):
+        if self.is_file_io_busy():
+            return
         self.editor_area.delete(1.0, tk.END)
         self.file_path = None
         # Clear output and console areas when a new file is opened
@@ -184,30 +770,182 @@ class CompilerUI(tk.Tk):
         self.console_area.delete(1.0, tk.END)
         self.console_area.config(state='disabled')
 
-    # Open file, read content, and populate editor area
+    # Open file and stream its content into the editor area
     def open_file(self):
+        if self.is_file_io_busy():
+            return
         self.file_path = filedialog.askopenfilename(filetypes=[('IOL files', '*.iol')])
         if self.file_path:
-            with open(self.file_path, 'r') as file:
-                code = file.read()
-            self.editor_area.delete(1.0, tk.END)
-            self.editor_area.insert(tk.END, code)
+            self.start_file_load(self.file_path)
 
     # Save file if file path exists
     def save_file(self):
+        if self.is_file_io_busy():
+            return
         if self.file_path:
-            with open(self.file_path, 'w') as file:
-                file.write(self.editor_area.get(1.0, tk.END).strip())
-            messagebox.showinfo('Info', 'File saved successfully.')
+            self.start_file_save(self.file_path)
         else:
             self.save_file_as()
 
     # Prompt user for a new file path to save the file
     def save_file_as(self):
+        if self.is_file_io_busy():
+            return
         self.file_path = filedialog.asksaveasfilename(defaultextension='.iol', filetypes=[('IOL files', '*.iol')])
         if self.file_path:
-            with open(self.file_path, 'w') as file:
-                file.write(self.editor_area.get(1.0, tk.END).strip())
+            self.start_file_save(self.file_path)
+
+    # Warn the user when a file is still being opened or saved
+    def is_file_io_busy(self):
+        if self.file_io_busy:
+            messagebox.showwarning('Warning', 'Please wait for the current file operation to finish.')
+        return self.file_io_busy
+
+    def start_file_load(self, path):
+        """
+        Reads a file on a background thread and streams it into the editor.
+
+        Args:
+            path (str): Path of the file to open.
+        """
+        try:
+            total_size = os.path.getsize(path)
+        except OSError as e:
+            self.file_path = None  # Save must not target a file that was never opened
+            messagebox.showerror('Error', f'Could not open file: {e}')
+            return
+
+        chunks = queue.Queue(maxsize=FILE_QUEUE_SIZE)
+        self.file_io_busy = True
+        self.editor_area.delete(1.0, tk.END)
+        self.editor_area.config(state='disabled')  # Keep edits out until the whole file is in
+        self.status_label.config(text=f'Opening {os.path.basename(path)}... 0%')
+
+        threading.Thread(target=self.read_file_chunks, args=(path, chunks), daemon=True).start()
+        self.after(FILE_POLL_INTERVAL, self.insert_file_chunks, path, chunks, total_size, 0)
+
+    # Background thread: read the file in chunks, then a None sentinel (or the error)
+    def read_file_chunks(self, path, chunks):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                while True:
+                    chunk = file.read(FILE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    chunks.put(chunk)
+            chunks.put(None)
+        except (OSError, UnicodeDecodeError) as e:
+            chunks.put(e)
+
+    # Insert the chunks read so far into the editor, a few per event loop slice
+    def insert_file_chunks(self, path, chunks, total_size, loaded):
+        self.editor_area.config(state='normal')
+        for _ in range(FILE_CHUNKS_PER_SLICE):
+            try:
+                chunk = chunks.get_nowait()
+            except queue.Empty:
+                break
+
+            if chunk is None:
+                self.file_io_busy = False
+                self.status_label.config(text=f'Opened {os.path.basename(path)}.')
+                return
+            if isinstance(chunk, Exception):
+                # Drop the partial buffer so Save cannot overwrite the original with it
+                self.editor_area.delete(1.0, tk.END)
+                self.file_path = None
+                self.file_io_busy = False
+                self.status_label.config(text='')
+                messagebox.showerror('Error', f'Could not open file: {chunk}')
+                return
+
+            self.editor_area.insert(tk.END, chunk)
+            loaded += len(chunk)
+        self.editor_area.config(state='disabled')
+
+        progress = min(100, loaded * 100 // max(total_size, 1))
+        self.status_label.config(text=f'Opening {os.path.basename(path)}... {progress}%')
+        self.after(FILE_POLL_INTERVAL, self.insert_file_chunks, path, chunks, total_size, loaded)
+
+    def start_file_save(self, path):
+        """
+        Streams the editor content, stripped of surrounding whitespace, to a file
+        written on a background thread.
+
+        Args:
+            path (str): Path of the file to save.
+        """
+        # Locate the stripped content without copying the whole buffer
+        start = self.editor_area.search(r'\S', '1.0', stopindex=tk.END, regexp=True)
+        if start:
+            last = self.editor_area.search(r'\S', tk.END, backwards=True, regexp=True)
+            end = self.editor_area.index(f'{last}+1c')
+        else:
+            start = end = '1.0'
+
+        chunks = queue.Queue(maxsize=FILE_QUEUE_SIZE)
+        outcome = queue.Queue()
+        self.file_io_busy = True
+        self.editor_area.config(state='disabled')  # Keep the buffer stable while it is written out
+        self.status_label.config(text=f'Saving {os.path.basename(path)}... 0%')
+
+        threading.Thread(target=self.write_file_chunks, args=(path, chunks, outcome), daemon=True).start()
+        self.after(FILE_POLL_INTERVAL, self.queue_editor_chunks, path, chunks, outcome, start, end)
+
+    # Background thread: write chunks to a temporary file and move it into place
+    def write_file_chunks(self, path, chunks, outcome):
+        temp_path = f'{path}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        break
+                    file.write(chunk)
+            os.replace(temp_path, path)
+            outcome.put(None)
+        except (OSError, UnicodeError) as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass  # Never created, or already gone
+            outcome.put(e)
+
+    # Hand the next block of editor lines to the writer thread
+    def queue_editor_chunks(self, path, chunks, outcome, start, end):
+        if not outcome.empty():
+            self.finish_file_save(path, outcome.get())
+            return
+
+        if start is None:
+            # Everything is queued; wait for the writer to report back
+            self.after(FILE_POLL_INTERVAL, self.queue_editor_chunks, path, chunks, outcome, None, end)
+            return
+
+        if not chunks.full():
+            stop = self.editor_area.index(f'{start}+{EDITOR_LINES_PER_SLICE} lines linestart')
+            if self.editor_area.compare(stop, '>=', end):
+                stop = end
+            chunks.put(self.editor_area.get(start, stop))
+
+            if stop == end:
+                chunks.put(None)
+                start = None
+            else:
+                start = stop
+                progress = int(start.split('.')[0]) * 100 // int(end.split('.')[0])
+                self.status_label.config(text=f'Saving {os.path.basename(path)}... {progress}%')
+
+        self.after(FILE_POLL_INTERVAL, self.queue_editor_chunks, path, chunks, outcome, start, end)
+
+    def finish_file_save(self, path, error):
+        self.file_io_busy = False
+        self.editor_area.config(state='normal')
+        if error:
+            self.status_label.config(text='')
+            messagebox.showerror('Error', f'Could not save file: {error}')
+        else:
+            self.status_label.config(text=f'Saved {os.path.basename(path)}.')
             messagebox.showinfo('Info', 'File saved successfully.')
 
     # Compile the code and perform lexical analysis
@@ -215,6 +953,9 @@ class CompilerUI(tk.Tk):
         """
         Handles the compilation of code entered by the user.
         """
+        if self.is_file_io_busy():
+            return
+
         # Get the code from the editor area
         code = self.editor_area.get(1.0, tk.END).strip()
         if not code:
@@ -223,6 +964,7 @@ class CompilerUI(tk.Tk):
 
         # Reset variables and token stream to ensure fresh compilation
         self.variables = {}  # Clear existing variables
+        self.input_values = {}  # Clear values entered for BEG
         self.token_stream = []  # Clear existing tokens
         self.error_list = []  # Clear previous errors
 
@@ -283,6 +1025,7 @@ class CompilerUI(tk.Tk):
 
                             if input_value is not None:  # User provided input
                                 self.variables[var_name]['value'] = input_value
+                                self.input_values[var_name] = input_value
                                 print(f'Input received for {var_name}: {input_value}')
                             else:
                                 messagebox.showwarning(
@@ -332,9 +1075,7 @@ class CompilerUI(tk.Tk):
             return
 
         # Save tokens with line numbers
-        token_content = '\n'.join(
-            f'{line_num} -> {lexeme} -> {token}' for line_num, lexeme, token in self.token_stream if token != 'NEWLN'
-        )
+        token_content = self.format_token_stream()
         with open(self.token_file_path, 'w') as file:
             file.write(token_content)
         messagebox.showinfo('Info', f'Tokenized output saved as {self.token_file_path}.')
@@ -347,170 +1088,6 @@ class CompilerUI(tk.Tk):
 
         self.semantic_analysis()
 
-    # Perform lexical analysis to generate tokens and identify errors
-    def lexical_analysis(self, code):
-        tokens = []
-        self.error_list = []
-        keywords = {
-            'IOL',
-            'LOI',
-            'INTO',
-            'IS',
-            'BEG',
-            'NEWLN',
-            'PRINT',
-            'ADD',
-            'SUB',
-            'MULT',
-            'DIV',
-            'MOD',
-        }
-        types = {'INT', 'STR'}
-        lines = code.splitlines()
-
-        for line_num, line in enumerate(lines, start=1):
-            words = line.split()
-            if not words:
-                continue
-
-            for i, word in enumerate(words):
-                if word in keywords or word in types:
-                    tokens.append((line_num, word, word))
-                    if word in types and i + 1 < len(words):
-                        var_name = words[i + 1]
-                        if var_name.isidentifier():
-                            default_value = 0 if word == 'INT' else 'Unassigned'
-                            self.variables[var_name] = {
-                                'type': word,
-                                'value': default_value,
-                            }
-                        else:
-                            self.error_list.append(f"Invalid identifier '{var_name}' on line {line_num}")
-                elif word.isdigit():
-                    tokens.append((line_num, word, 'INT_LIT'))
-                elif word.isidentifier():
-                    tokens.append((line_num, word, 'IDENT'))
-                else:
-                    tokens.append((line_num, word, 'ERR_LEX'))
-                    self.error_list.append(f"Unknown lexeme '{word}' on line {line_num}")
-
-            # Add a NEWLN token at the end of each line
-            last_word = words[-1]
-            if not last_word.endswith('LOI'):
-                tokens.append((line_num, '\\n', 'NEWLN'))
-
-        return tokens
-
-    def parse_tokens_with_grammar(self, productions: list, parse_table: dict) -> Tuple[bool, str]:
-        """
-        Parses tokens from the input field using a specified grammar.
-
-        Args:
-            productions (list): List of production rules as (line_number, non_terminal, production).
-            parse_table (dict): Dictionary representing the parse table.
-
-        Returns:
-            bool: True if the input is valid based on the grammar; False otherwise.
-        """
-        input_tokens = [token for _, __, token in self.token_stream]
-        error_msg = None
-        if not input_tokens:
-            error_msg = 'Error: No input tokens provided!'
-            print(error_msg)
-            return False, error_msg
-
-        starting_production_rule = productions[0][1]  # Start symbol is the LHS of the first production
-        stack = [starting_production_rule]
-        input_buffer = input_tokens + ['$']
-        parsing_steps = []
-        is_valid = True
-
-        while stack:
-            stack_top = stack[-1]
-            current_input = input_buffer[0]
-
-            # Match terminal symbols
-            if stack_top == current_input:
-                stack.pop()
-                input_buffer.pop(0)
-                action = f'Match {stack_top}'
-                print(action)
-
-            # Expand non-terminal symbols
-            elif stack_top in parse_table:
-                if current_input in parse_table[stack_top]:
-                    production_number = parse_table[stack_top][current_input]
-                    if production_number == '':
-                        error_msg = f'Error: No rule found for {stack_top} with input {current_input}'
-                        print(error_msg)
-                        is_valid = False
-                        break
-                    else:
-                        stack.pop()
-                        production = productions[int(production_number) - 1]
-                        rhs = production[2].split() if production[2] != 'e' else []
-                        stack.extend(reversed(rhs))
-                        action = f'Output {production[1]} -> {production[2]}'
-                        print(action)
-                else:
-                    error_msg = f'Error: No matching terminal for {stack_top} with input {current_input}'
-                    print(error_msg)
-                    is_valid = False
-                    break
-
-            # Handle unexpected tokens
-            else:
-                error_msg = f'Error: Unexpected token {stack_top}'
-                print(error_msg)
-                is_valid = False
-                break
-
-            parsing_steps.append((stack.copy(), input_buffer.copy(), action))
-
-        # Ensure input buffer is exhausted
-        if input_buffer != ['$']:
-            error_msg = 'Error: Input buffer not exhausted.'
-            print(error_msg)
-            return False, error_msg
-
-        return is_valid, error_msg
-
-    def load_productions(self, file_path):
-        """
-        Loads production rules from a .prod file.
-
-        Args:
-            file_path (str): Path to the production file.
-
-        Returns:
-            list: List of production rules.
-        """
-        productions = []
-        with open(file_path, newline='', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                productions.append(row)
-        return productions
-
-    def load_parse_table(self, file_path):
-        """
-        Loads parse table from a .ptbl file.
-
-        Args:
-            file_path (str): Path to the parse table file.
-
-        Returns:
-            dict: Dictionary representing the parse table.
-        """
-        parse_table = {}
-        with open(file_path, newline='', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            headers = next(reader)[1:]
-            for row in reader:
-                non_terminal = row[0]
-                parse_table[non_terminal] = {headers[i]: row[i + 1] for i in range(len(headers))}
-        return parse_table
-
     # Placeholder function for syntax analysis
     def syntax_analysis(self):
         if not self.token_saved:
@@ -561,128 +1138,14 @@ class CompilerUI(tk.Tk):
         self.console_area.config(state='normal')
         self.console_area.insert(tk.END, 'Performing Semantic Analysis...\n')
 
-        # Initialize semantic errors list
-        semantic_errors = []
-
-        # Start processing each token in the token stream
-        stack = []
-        current_var = None
-
-        print('Starting semantic analysis loop...')  # Debug line
-
-        def get_input_value(var_name):
-            # Get input value from the variables dictionary after prompt_for_inputs method is called
-            return self.variables.get(var_name, {}).get('value', 'undefined')
-
-        # Call the method to prompt for inputs
-        # self.prompt_for_inputs()
-
-        for i, (line_num, lexeme, token) in enumerate(self.token_stream):
-            # Handling declarations
-            if token in {'INT', 'STR'}:
-                stack.append(('DECLARATION', token))
-                current_var = lexeme
-                # Initialize variable with default values based on type
-                self.variables[current_var] = {'type': token, 'value': None}
-
-            elif token == 'IDENT':  # Handling identifier usage
-                var_name = lexeme
-                if var_name not in self.variables:
-                    semantic_errors.append(f"Line {line_num}: Undeclared variable '{var_name}' used.")
-                elif stack and stack[-1][0] == 'DECLARATION':
-                    stack.pop()
-                else:
-                    current_var = var_name  # Store current variable for assignment or input
-
-            elif token == 'INTO':
-                if current_var:
-                    stack.append(('ASSIGNMENT', current_var))
-                else:
-                    semantic_errors.append(f'Line {line_num}: Missing variable in assignment.')
-
-            elif token == 'IS':  # Handles the 'IS' keyword for assignment
-                if stack and stack[-1][0] == 'ASSIGNMENT':
-                    var_name = stack.pop()[1]  # Get variable to assign
-                    if var_name not in self.variables:
-                        semantic_errors.append(f"Line {line_num}: Undeclared variable '{var_name}' in assignment.")
-
-            elif token in {'ADD', 'SUB', 'MULT', 'DIV', 'MOD'}:  # Arithmetic operations
-                if current_var in self.variables:
-                    type1 = self.variables[current_var]['type']
-                    if type1 != 'INT':
-                        semantic_errors.append(
-                            f'Line {line_num}: Type mismatch: {token} operation requires INT, found {type1}.'
-                        )
-                else:
-                    semantic_errors.append(f"Line {line_num}: Invalid operation, variable '{current_var}' not found.")
-
-            elif token == 'INT_LIT':
-                if stack and stack[-1][0] == 'ASSIGNMENT':
-                    var_name = stack.pop()[1]  # Get variable to assign
-                    if self.variables[var_name]['type'] != 'INT':
-                        semantic_errors.append(
-                            f"Line {line_num}: Type mismatch: Cannot assign INT_LIT to '{var_name}' of type '{self.variables[var_name]['type']}'."
-                        )
-                    else:
-                        self.variables[var_name]['value'] = int(lexeme)
-                elif current_var in self.variables and self.variables[current_var]['type'] == 'INT':
-                    self.variables[current_var]['value'] = int(lexeme)
-                else:
-                    semantic_errors.append(
-                        f"Line {line_num}: Type mismatch or missing assignment context for '{current_var}'."
-                    )
-
-            elif token == 'BEG':  # Input operation after BEG keyword
-                if i + 1 < len(self.token_stream):
-                    next_token = self.token_stream[i + 1]
-                    next_lexeme = next_token[1]
-                    if next_lexeme in self.variables:
-                        var_name = next_lexeme
-                        input_value = get_input_value(var_name)
-                        self.variables[var_name]['value'] = input_value
-                        print(f'Input received for {var_name}: {input_value}')
-                    else:
-                        semantic_errors.append(
-                            f"Line {line_num}: Undeclared variable '{next_lexeme}' used in input operation."
-                        )
-                else:
-                    semantic_errors.append(f'Line {line_num}: Missing variable after BEG command.')
-
-            elif token == 'PRINT':  # Output operation
-                if i + 1 < len(self.token_stream):
-                    next_token = self.token_stream[i + 1]
-                    next_lexeme = next_token[1]
-                    next_token_type = next_token[2]
-                    if next_lexeme in self.variables:
-                        output_value = self.variables[next_lexeme]['value']
-                        print(f"DEBUG: PRINT operation for variable '{next_lexeme}': {output_value}")
-                        self.console_area.insert(tk.END, f'Line {line_num} Output: {output_value}\n')
-                    elif next_lexeme.isdigit():
-                        output_value = next_lexeme
-                        print(f"DEBUG: PRINT operation for digit '{next_lexeme}'")
-                        self.console_area.insert(tk.END, f'Line {line_num} Output: {output_value}\n')
-                    elif next_token_type in {'ADD', 'SUB', 'MULT', 'DIV', 'MOD'}:
-                        semantic_errors.append(
-                            f"Line {line_num}: Invalid operation '{next_lexeme}' in PRINT statement."
-                        )
-                    else:
-                        print(f'DEBUG: Invalid expression in PRINT operation for lexeme: {next_lexeme}')
-                        semantic_errors.append(f'Line {line_num}: Invalid expression in PRINT operation.')
-                else:
-                    semantic_errors.append(f'Line {line_num}: Missing expression after PRINT command.')
-
-            elif token == 'NEWLN':  # Handle new line
-                self.console_area.insert(tk.END, '\n')
-
-            elif token in {'IOL', 'LOI'}:  # Handle special tokens
-                continue  # Just ignore these tokens for now
-
-            else:
-                print(f'DEBUG: Unhandled token: {token} with lexeme: {lexeme}')
+        semantic_errors, program_output = self.check_semantics()
+        self.console_area.insert(tk.END, ''.join(program_output))
 
         # Display results of semantic analysis
         if semantic_errors:
-            error_msg = 'Static Semantic Analysis unsuccessful.\n\nSemantic Errors:\n' + '\n'.join(semantic_errors)
+            error_msg = 'Static Semantic Analysis unsuccessful.\n\nSemantic Errors:\n' + '\n'.join(
+                error for _, error in semantic_errors
+            )
             self.console_area.insert(tk.END, error_msg)
         else:
             self.console_area.insert(
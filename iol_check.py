@@ -0,0 +1,64 @@
+"""
+Fail-fast command-line checker for IOL programs.
+Streams each file through the single-pass lex, parse, and check pipeline and stops a
+file as soon as its error limit is reached.
+
+Usage:
+python iol_check.py program.iol [more.iol ...] [--error-limit 1]
+"""
+
+import argparse
+import sys
+
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+
+def error_limit(value: str) -> int:
+    limit = int(value)
+    if limit < 0:
+        raise argparse.ArgumentTypeError(f'Invalid error limit {value}. Expected 0 or a positive number.')
+    return limit
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Check IOL programs in a single pass.')
+    parser.add_argument('paths', nargs='+', help='.iol files to check.')
+    parser.add_argument(
+        '--error-limit',
+        type=error_limit,
+        default=1,
+        help='Stop checking a file after this many errors; 0 reports all of them.',
+    )
+    args = parser.parse_args(argv)
+
+    analyzer = IOLAnalyzer()
+    try:
+        analyzer.load_grammar()
+    except OSError as e:
+        print(f'Error: could not load the grammar: {e}')
+        return 2
+
+    failed = False
+    for path in args.paths:
+        try:
+            with open(path, 'r') as file:
+                diagnostics = analyzer.compile_stream(file, error_limit=args.error_limit)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f'{path}: could not be read: {e}')
+            failed = True
+            continue
+
+        if not diagnostics:
+            print(f'{path}: OK')
+            continue
+
+        failed = True
+        print(f'{path}: {len(diagnostics)} error(s)')
+        for phase, _, message in diagnostics:
+            print(f'  [{phase}] {message}')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
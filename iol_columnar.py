@@ -0,0 +1,322 @@
+"""
+Columnar export of IOL token streams and diagnostics.
+Stores each compiled program as NumPy arrays (token kind ids, line numbers, lexeme ids
+into a lexeme table, and diagnostics) and computes corpus statistics over those arrays
+with vectorized operations.
+
+Requires NumPy (pip install numpy).
+
+Usage:
+python iol_columnar.py export programs/ [more.iol ...] --output columns/ [--format npz|npy]
+python iol_columnar.py stats columns/
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+# Token kinds and diagnostic phases; a kind or phase id is its index in these tuples
+TOKEN_KINDS = (
+    'IOL',
+    'LOI',
+    'INT',
+    'STR',
+    'INTO',
+    'IS',
+    'BEG',
+    'PRINT',
+    'NEWLN',
+    'ADD',
+    'SUB',
+    'MULT',
+    'DIV',
+    'MOD',
+    'IDENT',
+    'INT_LIT',
+    'ERR_LEX',
+)
+TOKEN_KIND_IDS = {kind: kind_id for kind_id, kind in enumerate(TOKEN_KINDS)}
+
+PHASES = ('lexical', 'syntax', 'semantic')
+PHASE_IDS = {phase: phase_id for phase_id, phase in enumerate(PHASES)}
+
+# Arrays stored for every program, one .npy file each in the npy format
+COLUMN_NAMES = (
+    'kinds',
+    'lines',
+    'lexeme_ids',
+    'lexemes',
+    'diag_phases',
+    'diag_lines',
+    'diag_messages',
+)
+
+
+def build_columns(token_stream: list, diagnostics: list) -> dict:
+    """
+    Converts a token stream and its diagnostics into columnar arrays.
+
+    The NEWLN tokens the lexer adds at the end of every line are left out, as in the
+    .tkn format, so kind counts and tokens per line only cover tokens in the source.
+    NEWLN statements are kept.
+
+    Args:
+        token_stream (list): Tokens as (line_number, lexeme, token) tuples.
+        diagnostics (list): Diagnostics as (phase, line_number, message) tuples; line 0
+            means the diagnostic has no line.
+
+    Returns:
+        dict: Column name to NumPy array, with the keys in COLUMN_NAMES.
+    """
+    if token_stream:
+        line_numbers, lexemes, kinds = zip(*token_stream)
+    else:
+        line_numbers, lexemes, kinds = (), (), ()
+
+    kind_strings = np.array(kinds, dtype=str)
+    lexeme_strings = np.array(lexemes, dtype=str)
+    lines = np.array(line_numbers, dtype=np.uint32)
+    in_source = ~((kind_strings == 'NEWLN') & (lexeme_strings == '\\n'))
+
+    # Map the few distinct kind strings to ids, then gather ids for every token at once
+    kind_names, kind_inverse = np.unique(kind_strings[in_source], return_inverse=True)
+    kind_lookup = np.array([TOKEN_KIND_IDS[name] for name in kind_names], dtype=np.uint8)
+    lexeme_table, lexeme_ids = np.unique(lexeme_strings[in_source], return_inverse=True)
+
+    if diagnostics:
+        phases, diag_lines, messages = zip(*diagnostics)
+    else:
+        phases, diag_lines, messages = (), (), ()
+
+    return {
+        'kinds': kind_lookup[kind_inverse.reshape(-1)],
+        'lines': lines[in_source],
+        'lexeme_ids': lexeme_ids.reshape(-1).astype(np.uint32),
+        'lexemes': lexeme_table,
+        'diag_phases': np.array([PHASE_IDS[phase] for phase in phases], dtype=np.uint8),
+        'diag_lines': np.array(diag_lines, dtype=np.uint32),
+        'diag_messages': np.array(messages, dtype=str),
+    }
+
+
+def save_columns(columns: dict, path: str, file_format: str = 'npz') -> str:
+    """
+    Writes columns either as one .npz archive or as a directory of .npy files that
+    can be memory-mapped.
+
+    Args:
+        columns (dict): Columns returned by build_columns.
+        path (str): Output path without extension.
+        file_format (str): 'npz' or 'npy'.
+
+    Returns:
+        str: The path written.
+    """
+    if file_format == 'npz':
+        path = f'{path}.npz'
+        np.savez(path, **columns)
+    else:
+        os.makedirs(path, exist_ok=True)
+        for name in COLUMN_NAMES:
+            np.save(os.path.join(path, f'{name}.npy'), columns[name])
+    return path
+
+
+def load_columns(path: str) -> dict:
+    """
+    Loads columns saved by save_columns. Directories of .npy files are memory-mapped
+    instead of read into memory.
+
+    Args:
+        path (str): A .npz archive or a directory of .npy files.
+
+    Returns:
+        dict: Column name to NumPy array.
+    """
+    if os.path.isdir(path):
+        return {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r') for name in COLUMN_NAMES}
+    with np.load(path) as archive:
+        return {name: archive[name] for name in COLUMN_NAMES}
+
+
+def find_column_sets(paths: list) -> list:
+    """
+    Expands directories into the .npz archives and .npy column directories they contain.
+    """
+    found = []
+    for path in paths:
+        if not os.path.isdir(path) or os.path.exists(os.path.join(path, 'kinds.npy')):
+            found.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            for name in sorted(dirs):
+                if os.path.exists(os.path.join(root, name, 'kinds.npy')):
+                    found.append(os.path.join(root, name))
+            found.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.npz'))
+    return found
+
+
+def kind_histogram(columns: dict) -> np.ndarray:
+    """
+    Counts tokens of each kind; index i is the count of TOKEN_KINDS[i].
+    """
+    return np.bincount(columns['kinds'], minlength=len(TOKEN_KINDS))
+
+
+def line_density(columns: dict) -> np.ndarray:
+    """
+    Counts tokens on every line that has at least one token, in line order.
+    """
+    counts = np.bincount(columns['lines'])
+    return counts[counts > 0]
+
+
+def corpus_statistics(column_sets: list) -> dict:
+    """
+    Aggregates token and diagnostic statistics across a corpus of programs.
+
+    Args:
+        column_sets (list): Column dictionaries, one per program.
+
+    Returns:
+        dict: Token kind histogram, per-line density summary, and error rates.
+    """
+    histogram = np.zeros(len(TOKEN_KINDS), dtype=np.int64)
+    phase_counts = np.zeros(len(PHASES), dtype=np.int64)
+    densities = []
+    error_lines = 0
+    failed_programs = 0
+
+    for columns in column_sets:
+        histogram += kind_histogram(columns)
+        densities.append(line_density(columns))
+        phase_counts += np.bincount(columns['diag_phases'], minlength=len(PHASES))
+        diag_lines = columns['diag_lines']
+        error_lines += np.unique(diag_lines[diag_lines > 0]).size
+        failed_programs += int(diag_lines.size > 0)
+
+    density = np.concatenate(densities) if densities else np.zeros(0, dtype=np.int64)
+    token_count = int(histogram.sum())
+    line_count = int(density.size)
+
+    return {
+        'programs': len(column_sets),
+        'tokens': token_count,
+        'lines': line_count,
+        'kind_histogram': dict(zip(TOKEN_KINDS, histogram.tolist())),
+        'tokens_per_line_mean': float(density.mean()) if line_count else 0.0,
+        'tokens_per_line_max': int(density.max()) if line_count else 0,
+        'tokens_per_line_p95': float(np.percentile(density, 95)) if line_count else 0.0,
+        'errors_by_phase': dict(zip(PHASES, phase_counts.tolist())),
+        'errors_per_1000_tokens': 1000 * float(phase_counts.sum()) / max(token_count, 1),
+        'error_line_rate': error_lines / max(line_count, 1),
+        'failed_program_rate': failed_programs / max(len(column_sets), 1),
+    }
+
+
+def find_sources(paths: list) -> list:
+    """
+    Expands directories into the .iol files they contain.
+
+    Returns:
+        list: (source_path, relative_path) tuples; relative paths keep directory
+        structure so programs with the same name do not overwrite each other.
+    """
+    sources = []
+    for path in paths:
+        if not os.path.isdir(path):
+            sources.append((path, os.path.basename(path)))
+            continue
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith('.iol'):
+                    source = os.path.join(root, name)
+                    sources.append((source, os.path.relpath(source, path)))
+    return sources
+
+
+def export_sources(paths: list, output_dir: str, file_format: str) -> bool:
+    """
+    Compiles every source and saves its columns, skipping files that cannot be read.
+
+    Returns:
+        bool: True if every source was exported.
+    """
+    analyzer = IOLAnalyzer()
+    exported_all = True
+    for source, relative in find_sources(paths):
+        try:
+            with open(source, 'r', encoding='utf-8') as file:
+                code = file.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f'{source}: could not be read: {e}')
+            exported_all = False
+            continue
+        diagnostics = analyzer.compile_source(code)
+
+        columns = build_columns(analyzer.token_stream, diagnostics)
+        target = os.path.join(output_dir, os.path.splitext(relative)[0])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        written = save_columns(columns, target, file_format)
+        print(f"{source} -> {written} ({columns['kinds'].size} tokens, {len(diagnostics)} diagnostics)")
+    return exported_all
+
+
+def print_statistics(stats: dict) -> None:
+    print(f"Programs: {stats['programs']}")
+    print(f"Tokens:   {stats['tokens']}")
+    print(f"Lines:    {stats['lines']}")
+    print()
+    print('Token kinds:')
+    for kind, count in stats['kind_histogram'].items():
+        if count:
+            print(f'  {kind:<10} {count:>12} {100 * count / max(stats["tokens"], 1):>7.2f}%')
+    print()
+    print(
+        f"Tokens per line: mean {stats['tokens_per_line_mean']:.2f}, "
+        f"p95 {stats['tokens_per_line_p95']:.2f}, max {stats['tokens_per_line_max']}"
+    )
+    print()
+    print('Errors by phase: ' + ', '.join(f'{phase} {count}' for phase, count in stats['errors_by_phase'].items()))
+    print(f"Errors per 1000 tokens: {stats['errors_per_1000_tokens']:.3f}")
+    print(f"Lines with errors:      {100 * stats['error_line_rate']:.2f}%")
+    print(f"Programs with errors:   {100 * stats['failed_program_rate']:.2f}%")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Export IOL token streams as columns and compute corpus statistics.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help='Compile .iol files and save their columns.')
+    export_parser.add_argument('paths', nargs='+', help='.iol files or directories containing them.')
+    export_parser.add_argument('--output', default='columns', help='Directory to write the columns to.')
+    export_parser.add_argument(
+        '--format',
+        choices=['npz', 'npy'],
+        default='npz',
+        help='One .npz archive per program, or one directory of memory-mappable .npy files.',
+    )
+
+    stats_parser = commands.add_parser('stats', help='Print statistics across exported programs.')
+    stats_parser.add_argument('paths', nargs='+', help='Exported programs or directories containing them.')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        if not export_sources(args.paths, args.output, args.format):
+            return 1
+    else:
+        column_sets = [load_columns(path) for path in find_column_sets(args.paths)]
+        if not column_sets:
+            print('No exported programs found.')
+            return 1
+        print_statistics(corpus_statistics(column_sets))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
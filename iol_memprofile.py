@@ -0,0 +1,294 @@
+"""
+Memory benchmark mode for the IOL compiler.
+Runs each analysis phase, and the single-pass pipeline that fuses them, under
+tracemalloc on generated corpora, reports peak and retained memory per phase and per
+token, and fails when a phase exceeds its budget.
+
+Usage:
+python iol_memprofile.py [--sizes 50 100 200] [--top 5] [--budget syntax=4096]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+# Peak bytes allowed per token for each phase, in the order the phases run
+PHASE_BUDGETS = {
+    'lexical': 1024,
+    'serialize': 256,
+    'syntax': 1024,
+    'semantic': 512,
+    'pipelined': 1024,
+}
+
+DEFAULT_SIZES = [50, 100, 200]
+
+# Growth factor over the last sampled high before the allocation sites are sampled again
+PEAK_SAMPLE_STEP = 1.1
+
+# Allocations made by the profiler itself are not attributed to any phase
+TRACE_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def generate_corpus(statement_count: int, seed: int = 0) -> str:
+    """
+    Generates a syntactically valid IOL program with the given number of statements.
+
+    Args:
+        statement_count (int): Number of statements between IOL and LOI.
+        seed (int): Seed for the random statement mix, so runs are reproducible.
+
+    Returns:
+        str: The program source code.
+    """
+    rng = random.Random(seed)
+    int_vars = ['n0']
+    str_vars = ['s0']
+    lines = ['IOL', 'INT n0 IS 0', 'STR s0']
+
+    for _ in range(statement_count):
+        kind = rng.randrange(6)
+        if kind == 0:
+            name = f'n{len(int_vars)}'
+            int_vars.append(name)
+            lines.append(f'INT {name} IS {rng.randrange(1000)}')
+        elif kind == 1:
+            name = f's{len(str_vars)}'
+            str_vars.append(name)
+            lines.append(f'STR {name}')
+        elif kind == 2:
+            operation = rng.choice(['ADD', 'SUB', 'MULT', 'DIV', 'MOD'])
+            lines.append(f'INTO {rng.choice(int_vars)} IS {operation} {rng.choice(int_vars)} {rng.randrange(1, 100)}')
+        elif kind == 3:
+            lines.append(f'BEG {rng.choice(rng.choice([int_vars, str_vars]))}')
+        elif kind == 4:
+            lines.append(f'PRINT {rng.choice(int_vars)}')
+        else:
+            lines.append('NEWLN')
+
+    lines.append('LOI')
+    return '\n'.join(lines)
+
+
+def run_syntax_phase(analyzer: IOLAnalyzer) -> Tuple[bool, str]:
+    return analyzer.parse_tokens_with_grammar(
+        productions=analyzer.productions_values, parse_table=analyzer.parse_table_values, trace=None
+    )
+
+
+def run_pipelined_phase(analyzer: IOLAnalyzer, source_path: str) -> list:
+    # Stream from disk so the measurement shows what the pipeline itself keeps in memory
+    with open(source_path, 'r') as file:
+        return analyzer.compile_stream(file, error_limit=0)
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, before: tracemalloc.Snapshot, top: int) -> list:
+    """
+    Lists the allocation sites that grew the most between two snapshots.
+
+    Returns:
+        list: Up to top (location, size_diff, count_diff) tuples, largest growth first.
+    """
+    sites = []
+    for stat in snapshot.compare_to(before, 'lineno'):
+        if len(sites) == top:
+            break
+        if stat.size_diff <= 0:
+            continue  # compare_to orders by absolute difference, so shrinking sites come mixed in
+        frame = stat.traceback[0]
+        sites.append((f'{os.path.basename(frame.filename)}:{frame.lineno}', stat.size_diff, stat.count_diff))
+    return sites
+
+
+class PeakSampler:
+    """
+    Profile hook that snapshots the allocation sites whenever traced memory reaches a
+    new high, so the sites behind a phase's peak can be reported.
+
+    A snapshot is only taken once memory grows past PEAK_SAMPLE_STEP of the last
+    sampled high, and the tracemalloc peak is reset after each one, so the snapshots
+    themselves never count toward the peak.
+    """
+
+    def __init__(self, before: tracemalloc.Snapshot, baseline: int, top: int):
+        self.before = before
+        self.baseline = baseline
+        self.top = top
+        self.peak = 0  # Highest traced memory seen, ignoring the snapshots taken
+        self.sampled = 0  # Traced memory above baseline at the last snapshot
+        self.sites = []
+
+    def __call__(self, frame, event, arg):
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak - self.baseline)
+        growth = current - self.baseline
+        if growth > self.sampled * PEAK_SAMPLE_STEP:
+            snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+            self.sites = top_sites(snapshot, self.before, self.top)
+            self.sampled = growth
+            del snapshot
+            tracemalloc.reset_peak()
+
+
+def measure_phase(phase: Callable, top: int) -> Tuple[object, int, int, list, list]:
+    """
+    Runs a single phase under tracemalloc.
+
+    Args:
+        phase (Callable): Zero-argument callable running the phase.
+        top (int): Number of allocation sites to report.
+
+    Returns:
+        tuple: The phase result, peak bytes, retained bytes, and the top allocation
+        sites near the peak and of the retained memory, each as (location, size_diff,
+        count_diff) tuples.
+    """
+    before = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    baseline, _ = tracemalloc.get_traced_memory()
+    sampler = PeakSampler(before, baseline, top)
+    tracemalloc.reset_peak()
+
+    sys.setprofile(sampler)
+    try:
+        result = phase()
+    finally:
+        sys.setprofile(None)
+
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+
+    peak = max(sampler.peak, peak - baseline)
+    return result, peak, current - baseline, sampler.sites, top_sites(after, before, top)
+
+
+def profile_corpus(code: str, top: int) -> List[dict]:
+    """
+    Profiles every phase of the pipeline on one program.
+
+    Args:
+        code (str): Program source code.
+        top (int): Number of allocation sites to report per phase.
+
+    Returns:
+        list: One report dictionary per phase, in pipeline order.
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.iol', delete=False) as file:
+        file.write(code)
+        source_path = file.name
+
+    # Load the grammar before measuring; it is read once and shared by every compile
+    analyzer = IOLAnalyzer()
+    analyzer.load_grammar()
+    stream_analyzer = IOLAnalyzer()
+    stream_analyzer.load_grammar()
+    phases = [
+        ('lexical', lambda: analyzer.token_stream.extend(analyzer.lexical_analysis(code))),
+        ('serialize', analyzer.format_token_stream),
+        ('syntax', lambda: run_syntax_phase(analyzer)),
+        ('semantic', analyzer.check_semantics),
+        ('pipelined', lambda: run_pipelined_phase(stream_analyzer, source_path)),
+    ]
+
+    reports = []
+    results = []  # Keep each phase's output alive so its memory counts as retained
+    tracemalloc.start()
+    try:
+        for name, phase in phases:
+            result, peak, retained, peak_sites, retained_sites = measure_phase(phase, top)
+            results.append(result)
+            reports.append(
+                {
+                    'phase': name,
+                    'peak': peak,
+                    'retained': retained,
+                    'peak_sites': peak_sites,
+                    'retained_sites': retained_sites,
+                }
+            )
+    finally:
+        tracemalloc.stop()
+        os.remove(source_path)
+
+    token_count = max(len(analyzer.token_stream), 1)
+    for report in reports:
+        report['tokens'] = token_count
+        report['peak_per_token'] = report['peak'] / token_count
+        report['retained_per_token'] = report['retained'] / token_count
+    return reports
+
+
+def parse_budget(value: str) -> Tuple[str, int]:
+    phase, _, limit = value.partition('=')
+    if phase not in PHASE_BUDGETS or not limit.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"Invalid budget '{value}'. Expected PHASE=BYTES with PHASE in {list(PHASE_BUDGETS)}."
+        )
+    return phase, int(limit)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Profile memory use of each IOL compiler phase.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Statements per generated corpus.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the corpus generator.')
+    parser.add_argument('--top', type=int, default=5, help='Allocation sites to list per phase.')
+    parser.add_argument(
+        '--budget',
+        type=parse_budget,
+        action='append',
+        default=[],
+        metavar='PHASE=BYTES',
+        help='Override the peak bytes-per-token budget of a phase.',
+    )
+    args = parser.parse_args(argv)
+
+    budgets = dict(PHASE_BUDGETS)
+    budgets.update(args.budget)
+
+    failures = []
+    for size in args.sizes:
+        reports = profile_corpus(generate_corpus(size, args.seed), args.top)
+        print(f'Corpus: {size} statements, {reports[0]["tokens"]} tokens')
+        print(
+            f'  {"Phase":<10} {"Peak":>12} {"Retained":>12} {"Peak/tok":>10} {"Ret/tok":>10} {"Budget":>8}  Status'
+        )
+        for report in reports:
+            budget = budgets[report['phase']]
+            status = 'OK' if report['peak_per_token'] <= budget else 'OVER'
+            if status == 'OVER':
+                failures.append(
+                    f"{report['phase']} phase on {size} statements: "
+                    f"{report['peak_per_token']:.1f} bytes/token exceeds budget of {budget}"
+                )
+            print(
+                f'  {report["phase"]:<10} {report["peak"]:>12} {report["retained"]:>12} '
+                f'{report["peak_per_token"]:>10.1f} {report["retained_per_token"]:>10.1f} {budget:>8}  {status}'
+            )
+
+        for title, key in [('at peak', 'peak_sites'), ('of retained memory', 'retained_sites')]:
+            print(f'  Top allocation sites {title}:')
+            for report in reports:
+                for location, size_diff, count_diff in report[key]:
+                    print(f'    {report["phase"]:<10} {location:<45} {size_diff:>10} bytes in {count_diff} blocks')
+        print()
+
+    if failures:
+        print('Memory budget exceeded:')
+        for failure in failures:
+            print(f'  {failure}')
+        return 1
+
+    print('All phases within memory budget.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
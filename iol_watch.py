@@ -0,0 +1,146 @@
+"""
+Watch mode for the IOL compiler.
+Polls a directory tree for .iol files and recompiles only the files whose content
+changed, printing each file's diagnostics as soon as it is compiled.
+
+Usage:
+python iol_watch.py programs/ [--interval 1.0] [--once]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from typing import Iterator, Optional, Tuple
+
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+
+def scan_tree(root: str, suffix: str = '.iol') -> Iterator[Tuple[str, int, int]]:
+    """
+    Walks a directory tree with os.scandir, reusing the directory entries' stat data.
+
+    Args:
+        root (str): Directory to scan.
+        suffix (str): File name suffix of the sources to report.
+
+    Yields:
+        tuple: (path, mtime_ns, size) of every matching file.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue  # Removed between listing and stat
+                        yield entry.path, stat.st_mtime_ns, stat.st_size
+        except OSError:
+            continue  # Removed or unreadable directory
+
+
+class IOLWatcher:
+    """
+    Tracks the .iol files of a directory tree between polls.
+
+    A file is only read when its mtime or size changed, and only recompiled when the
+    hash of its content changed too.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.analyzer = IOLAnalyzer()  # Reused so the grammar files are loaded once
+        self.states = {}  # Path to (mtime_ns, size, content digest)
+
+    def poll(self) -> Iterator[Tuple[str, Optional[list]]]:
+        """
+        Scans the tree once.
+
+        Yields:
+            tuple: (path, diagnostics) for every new or changed file as soon as it is
+            compiled, and (path, None) for every file that was removed.
+        """
+        seen = set()
+        for path, mtime_ns, size in scan_tree(self.root):
+            seen.add(path)
+            state = self.states.get(path)
+            if state is not None and state[0] == mtime_ns and state[1] == size:
+                continue
+
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+            except OSError:
+                continue  # Picked up again on the next poll if it still exists
+
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            self.states[path] = (mtime_ns, size, digest)
+            if state is not None and state[2] == digest:
+                continue  # Touched but not changed
+
+            yield path, self.analyzer.compile_source(data.decode('utf-8', errors='replace'))
+
+        for path in self.states.keys() - seen:
+            del self.states[path]
+            yield path, None
+
+
+def report(path: str, diagnostics: Optional[list]) -> None:
+    if diagnostics is None:
+        print(f'{path}: removed', flush=True)
+    elif not diagnostics:
+        print(f'{path}: OK', flush=True)
+    else:
+        lines = [f'{path}: {len(diagnostics)} error(s)']
+        lines.extend(f'  [{phase}] {message}' for phase, _, message in diagnostics)
+        print('\n'.join(lines), flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Recompile changed .iol files in a directory tree.')
+    parser.add_argument('root', help='Directory to watch.')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between scans.')
+    parser.add_argument('--once', action='store_true', help='Compile every file once and exit.')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        print(f"Error: '{args.root}' is not a directory.")
+        return 2
+
+    watcher = IOLWatcher(args.root)
+    failed = set()
+    try:
+        while True:
+            started = time.perf_counter()
+            changed = 0
+            for path, diagnostics in watcher.poll():
+                changed += 1
+                report(path, diagnostics)
+                if diagnostics:
+                    failed.add(path)
+                else:
+                    failed.discard(path)
+
+            if changed:
+                elapsed = (time.perf_counter() - started) * 1000
+                print(
+                    f'-- {changed} file(s) updated, {len(failed)} with errors, '
+                    f'{len(watcher.states)} watched ({elapsed:.0f} ms)',
+                    flush=True,
+                )
+            if args.once:
+                return 1 if failed else 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
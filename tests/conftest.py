@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The compiler and its tools are top-level scripts, and the grammar files are read
+# relative to the working directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,72 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import iol_columnar  # noqa: E402
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer  # noqa: E402
+
+
+def export(code):
+    analyzer = IOLAnalyzer()
+    diagnostics = analyzer.compile_source(code)
+    return iol_columnar.build_columns(analyzer.token_stream, diagnostics)
+
+
+def test_line_end_markers_are_not_exported():
+    columns = export('IOL\nINT x IS 5\nNEWLN\nPRINT x\nLOI')
+    kinds = [iol_columnar.TOKEN_KINDS[kind_id] for kind_id in columns['kinds']]
+    assert kinds == ['IOL', 'INT', 'IDENT', 'IS', 'INT_LIT', 'NEWLN', 'PRINT', 'IDENT', 'LOI']
+    assert columns['lines'].tolist() == [1, 2, 2, 2, 2, 3, 4, 4, 5]
+    assert columns['lexemes'][columns['lexeme_ids']].tolist() == ['IOL', 'INT', 'x', 'IS', '5', 'NEWLN', 'PRINT', 'x', 'LOI']
+
+
+@pytest.mark.parametrize(
+    'code, phase, line',
+    [
+        ('IOL\nINT x IS 5\nfoo$\nLOI', 'lexical', 3),
+        ('IOL\nINT x IS 5\nPRINT x y$LOI\nINT z IS 1\nLOI', 'lexical', 3),
+        ('IOL\nINT 9x IS 5\nLOI', 'lexical', 2),
+        ('IOL\nINT x IS 5\nPRINT ADD x\nLOI', 'syntax', 3),
+        ('IOL\nINT x IS 5\nSTR s\nINTO x IS s\nLOI', 'semantic', 4),
+    ],
+)
+def test_diagnostics_carry_their_line(code, phase, line):
+    columns = export(code)
+    count = columns['diag_messages'].size
+    assert count > 0
+    assert columns['diag_phases'].tolist() == [iol_columnar.PHASE_IDS[phase]] * count
+    assert columns['diag_lines'].tolist() == [line] * count
+
+
+@pytest.mark.parametrize('file_format', ['npz', 'npy'])
+def test_statistics_after_round_trip(tmp_path, file_format):
+    programs = {
+        'good': 'IOL\nINT x IS 5\nPRINT ADD x 1\nLOI',
+        'bad': 'IOL\nINT x IS 5\nPRINT ADD x\nLOI',
+    }
+    column_sets = []
+    for name, code in programs.items():
+        path = iol_columnar.save_columns(export(code), str(tmp_path / name), file_format)
+        column_sets.append(iol_columnar.load_columns(path))
+
+    stats = iol_columnar.corpus_statistics(column_sets)
+    assert stats['tokens'] == 19
+    assert stats['lines'] == 8
+    assert stats['kind_histogram']['NEWLN'] == 0
+    assert stats['errors_by_phase'] == {'lexical': 0, 'syntax': 1, 'semantic': 0}
+    assert stats['error_line_rate'] == 1 / 8
+    assert stats['failed_program_rate'] == 0.5
+
+
+def test_export_skips_unreadable_sources(tmp_path, capsys):
+    sources = tmp_path / 'programs'
+    sources.mkdir()
+    (sources / 'a_bad.iol').write_bytes(b'IOL\nPRINT \xff\nLOI')
+    (sources / 'b_good.iol').write_text('IOL\nINT x IS 5\nPRINT x\nLOI')
+    output = tmp_path / 'columns'
+
+    assert iol_columnar.main(['export', str(sources), '--output', str(output)]) == 1
+    printed = capsys.readouterr().out
+    assert 'a_bad.iol: could not be read' in printed
+    assert 'b_good.npz (8 tokens, 0 diagnostics)' in printed
+    assert sorted(path.name for path in output.iterdir()) == ['b_good.npz']
@@ -0,0 +1,55 @@
+import queue
+
+from Carballo_Pelayo_Sarmiento_PE04 import CompilerUI
+
+
+def write(path, *chunks):
+    pending = queue.Queue()
+    for chunk in chunks:
+        pending.put(chunk)
+    pending.put(None)
+    outcome = queue.Queue()
+    CompilerUI.write_file_chunks(None, str(path), pending, outcome)
+    return outcome.get_nowait()
+
+
+def read(path):
+    chunks = queue.Queue()
+    CompilerUI.read_file_chunks(None, str(path), chunks)
+    parts = []
+    while True:
+        chunk = chunks.get_nowait()
+        if chunk is None or isinstance(chunk, Exception):
+            return ''.join(parts), chunk
+        parts.append(chunk)
+
+
+def test_save_round_trips_as_utf8(tmp_path):
+    path = tmp_path / 'prog.iol'
+    assert write(path, 'IOL\n', 'PRINT x ✓\n', 'LOI') is None
+    assert path.read_bytes().decode('utf-8') == 'IOL\nPRINT x ✓\nLOI'
+    assert read(path) == ('IOL\nPRINT x ✓\nLOI', None)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_unencodable_save_reports_error_and_keeps_original(tmp_path):
+    path = tmp_path / 'prog.iol'
+    path.write_text('IOL\nLOI')
+    error = write(path, 'IOL\n', 'PRINT \ud800\n', 'LOI')
+    assert isinstance(error, UnicodeEncodeError)
+    assert path.read_text() == 'IOL\nLOI'
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_failed_save_removes_temp_file(tmp_path):
+    path = tmp_path / 'prog.iol'
+    path.mkdir()  # Moving the temporary file over a directory fails
+    assert isinstance(write(path, 'IOL\nLOI'), OSError)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_undecodable_load_reports_error(tmp_path):
+    path = tmp_path / 'prog.iol'
+    path.write_bytes(b'IOL\n\xff\xfe\nLOI')
+    _, error = read(path)
+    assert isinstance(error, UnicodeDecodeError)
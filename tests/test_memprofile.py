@@ -0,0 +1,46 @@
+import tracemalloc
+
+import iol_memprofile
+
+
+def transient_phase():
+    scratch = [str(i) for i in range(20000)]  # Freed before the phase returns
+    kept = [str(i) for i in range(100)]
+    del scratch
+    return kept
+
+
+def measure(phase, top=3):
+    tracemalloc.start()
+    try:
+        return iol_memprofile.measure_phase(phase, top)
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_sites_include_freed_allocations():
+    kept, peak, retained, peak_sites, retained_sites = measure(transient_phase)
+    assert len(kept) == 100
+    assert peak > 20000 * 40 > retained
+    assert peak_sites[0][1] > 20000 * 40
+    assert all(size_diff < 20000 * 40 for _, size_diff, _ in retained_sites)
+
+
+def test_sites_only_list_growth():
+    garbage = [str(i) for i in range(5000)]
+
+    def shrinking_phase():
+        garbage.clear()
+        return [str(i) for i in range(10)]
+
+    *_, peak_sites, retained_sites = measure(shrinking_phase, top=5)
+    assert retained_sites
+    assert all(size_diff > 0 for _, size_diff, _ in peak_sites + retained_sites)
+
+
+def test_profile_corpus_reports_every_phase():
+    reports = iol_memprofile.profile_corpus(iol_memprofile.generate_corpus(20), top=2)
+    assert [report['phase'] for report in reports] == list(iol_memprofile.PHASE_BUDGETS)
+    for report in reports:
+        assert report['peak'] >= report['retained']
+        assert len(report['peak_sites']) <= 2
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+
+import iol_check
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+
+def test_lexical_error_on_last_token_is_reported():
+    code = 'IOL\nINT x IS 5\n@LOI'
+    diagnostics = IOLAnalyzer().compile_stream(io.StringIO(code), error_limit=0)
+    assert ('lexical', 3, "Unknown lexeme '@LOI' on line 3") in diagnostics
+    assert IOLAnalyzer().compile_stream(io.StringIO(code))[0][0] == 'lexical'
+
+
+@pytest.mark.parametrize(
+    'code',
+    [
+        'IOL\nINT 9x IS 5\nLOI',
+        'IOL\nINT x IS 5\nfoo$ 1 2\nPRINT bar#\nLOI',
+        'IOL\nINT x IS 5\nPRINT ADD x\nINTO y IS 3\nLOI',
+        'IOL\nINT x IS 5\nSTR s\nINTO x IS s\nPRINT y\nLOI',
+    ],
+)
+def test_stream_matches_batch_diagnostics(code):
+    expected = IOLAnalyzer().compile_source(code)
+    assert expected
+    assert IOLAnalyzer().compile_stream(io.StringIO(code), error_limit=0) == expected
+    assert IOLAnalyzer().compile_stream(io.StringIO(code), error_limit=1) == expected[:1]
+
+
+def test_negative_error_limit_is_rejected():
+    with pytest.raises(ValueError):
+        IOLAnalyzer().compile_stream(io.StringIO('IOL\nLOI'), error_limit=-1)
+    with pytest.raises(SystemExit):
+        iol_check.main(['program.iol', '--error-limit', '-1'])
+
+
+def test_missing_grammar_is_not_blamed_on_the_source(tmp_path, monkeypatch, capsys):
+    source = tmp_path / 'program.iol'
+    source.write_text('IOL\nLOI')
+    monkeypatch.chdir(tmp_path)
+    assert iol_check.main([str(source)]) == 2
+    assert 'could not load the grammar' in capsys.readouterr().out
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+from Carballo_Pelayo_Sarmiento_PE04 import IOLAnalyzer
+
+
+def program(*statements):
+    return '\n'.join(['IOL', *statements, 'LOI'])
+
+
+def compile_both(code):
+    """
+    Compiles a program in batch and in single-pass mode and returns both results.
+    """
+    analyzer = IOLAnalyzer()
+    return analyzer.compile_source(code), analyzer.compile_stream(io.StringIO(code), error_limit=0)
+
+
+def semantic_messages(diagnostics):
+    return [message for phase, _, message in diagnostics if phase == 'semantic']
+
+
+def run_checker(code, inputs=None):
+    """
+    Runs the semantic checker the way the GUI does, with values entered for BEG.
+    """
+    analyzer = IOLAnalyzer()
+    analyzer.token_stream = analyzer.lexical_analysis(code)
+    analyzer.input_values = inputs or {}
+    return analyzer.check_semantics()
+
+
+@pytest.mark.parametrize(
+    'statements, expected',
+    [
+        (
+            ('INT x IS 5', 'STR s', 'INTO x IS ADD s 1'),
+            ['Line 4: Type mismatch: ADD operation requires INT, found STR.'],
+        ),
+        (
+            ('INT x IS 5', 'STR s', 'PRINT MULT x s'),
+            ['Line 4: Type mismatch: MULT operation requires INT, found STR.'],
+        ),
+        (
+            ('INT x IS 5', 'STR s', 'INTO s IS ADD x 1'),
+            ["Line 4: Type mismatch: Cannot assign INT expression to 's' of type 'STR'."],
+        ),
+        (
+            ('INT x IS 5', 'STR s', 'INTO x IS s'),
+            ["Line 4: Type mismatch: Cannot assign STR expression to 'x' of type 'INT'."],
+        ),
+        (
+            ('INT x IS 0', 'INT y IS 1', 'INTO y IS DIV 10 x'),
+            ['Line 4: Division by zero in DIV operation.'],
+        ),
+    ],
+)
+def test_type_errors(statements, expected):
+    for diagnostics in compile_both(program(*statements)):
+        assert semantic_messages(diagnostics) == expected
+
+
+def test_valid_program_has_no_diagnostics():
+    code = program('INT x IS 5', 'INT y IS 2', 'STR s', 'INTO y IS MULT ADD x 2 3', 'PRINT SUB y x', 'BEG s', 'PRINT s')
+    assert compile_both(code) == ([], [])
+
+
+def test_beg_makes_value_unknown_without_input():
+    code = program('INT x IS 0', 'BEG x', 'INT y IS 1', 'INTO y IS DIV 10 x')
+    assert compile_both(code) == ([], [])
+
+
+def test_beg_uses_entered_value():
+    errors, output = run_checker(program('INT x IS 5', 'BEG x', 'PRINT x'), inputs={'x': 42})
+    assert errors == []
+    assert output == ['Line 4 Output: 42\n']
+
+
+def test_large_values_are_not_folded():
+    statements = ['INT x IS 99999'] + ['INTO x IS MULT x x'] * 24 + ['PRINT x']
+    assert compile_both(program(*statements)) == ([], [])
+
+    errors, output = run_checker(program(*statements))
+    assert errors == []
+    assert output == ['Line 27 Output: Unknown\n']
+
+
+def test_values_without_input_print_as_unknown():
+    errors, output = run_checker(program('STR s', 'INT x IS 5', 'BEG s', 'BEG x', 'PRINT s', 'PRINT ADD x 1'))
+    assert errors == []
+    assert output == ['Line 6 Output: Unknown\n', 'Line 7 Output: Unknown\n']
@@ -0,0 +1,55 @@
+import os
+
+import iol_watch
+
+
+def write(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))  # Explicit times so coarse clocks cannot hide a change
+
+
+def poll(watcher):
+    return {os.path.basename(path): diagnostics for path, diagnostics in watcher.poll()}
+
+
+def test_only_new_and_changed_files_are_compiled(tmp_path):
+    nested = tmp_path / 'nested'
+    nested.mkdir()
+    good = tmp_path / 'good.iol'
+    bad = nested / 'bad.iol'
+    write(good, 'IOL\nINT x IS 5\nPRINT x\nLOI', 1_000_000_000)
+    write(bad, 'IOL\nPRINT ADD 1\nLOI', 1_000_000_000)
+    (tmp_path / 'notes.txt').write_text('not a program')
+
+    watcher = iol_watch.IOLWatcher(str(tmp_path))
+    results = poll(watcher)
+    assert results.keys() == {'good.iol', 'bad.iol'}
+    assert results['good.iol'] == []
+    assert [phase for phase, _, _ in results['bad.iol']] == ['syntax']
+    assert poll(watcher) == {}
+
+
+def test_touched_file_is_skipped_and_changed_file_is_recompiled(tmp_path):
+    source = tmp_path / 'program.iol'
+    write(source, 'IOL\nINT x IS 5\nLOI', 1_000_000_000)
+    watcher = iol_watch.IOLWatcher(str(tmp_path))
+    assert poll(watcher) == {'program.iol': []}
+
+    os.utime(source, ns=(2_000_000_000, 2_000_000_000))
+    assert poll(watcher) == {}
+
+    write(source, 'IOL\nINT x IS y\nLOI', 3_000_000_000)  # Same size, new content
+    diagnostics = poll(watcher)['program.iol']
+    assert diagnostics and diagnostics[0][1] == 2
+
+
+def test_removed_file_is_reported_once(tmp_path):
+    source = tmp_path / 'program.iol'
+    write(source, 'IOL\nLOI', 1_000_000_000)
+    watcher = iol_watch.IOLWatcher(str(tmp_path))
+    poll(watcher)
+
+    source.unlink()
+    assert list(watcher.poll()) == [(str(source), None)]
+    assert poll(watcher) == {}
+    assert watcher.states == {}